@@ -5,12 +5,31 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
+
+To serve it with uvicorn workers under gunicorn (see ``gunicorn.conf.py``):
+
+    gunicorn -c gunicorn.conf.py
+
+or with uvicorn alone:
+
+    uvicorn Ecommerce.asgi:application --workers 4 --timeout-keep-alive 75
 """
 
 import os
+import time
+
+_import_started = time.perf_counter()
 
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'Ecommerce.settings')
 
 application = get_asgi_application()
+
+from ecom.asgi import ASGIStaticFiles
+
+application = ASGIStaticFiles(application)
+
+from ecom.warmup import record_import_time
+
+record_import_time(time.perf_counter() - _import_started)
@@ -23,6 +23,9 @@ INSTALLED_APPS = [
     'ecom'
 ]
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
+# Every entry must be async-capable (checked by ecom.checks) so requests stay
+# on the event loop under ASGI. Static files are served ahead of this chain
+# by ecom.asgi.ASGIStaticFiles.
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -46,11 +49,23 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'ecom.context_processors.cart_item_count',
             ],
         },
     },
 ]
 
+# Templates are compiled once per process in production. The navbar and
+# footer partials are additionally cached as rendered fragments.
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
 WSGI_APPLICATION = 'Ecommerce.wsgi.application'
 
 # Database
@@ -62,6 +77,22 @@ DATABASES = {
         "PASSWORD": "root",
         "HOST": "localhost",
         "PORT": "5432",
+        # Keep connections open between requests and check them before reuse.
+        # The ASGI profile in gunicorn.conf.py sets DB_CONN_MAX_AGE=0, since
+        # persistent connections are unsupported under ASGI.
+        "CONN_MAX_AGE": int(os.environ.get("DB_CONN_MAX_AGE", 60)),
+        "CONN_HEALTH_CHECKS": True,
+    }
+}
+
+# Cache
+# Cart counters, rate limit windows and page caches are shared by every
+# worker process, so the cache must be too.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.environ.get("REDIS_URL", "redis://127.0.0.1:6379/1"),
+        "KEY_PREFIX": "furni",
     }
 }
 
@@ -82,6 +113,22 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Login/register throttling: (attempts, window in seconds), checked per
+# client IP and per email before any password hashing happens.
+AUTH_RATE_LIMITS = {
+    "ip": (20, 60),
+    "email": (5, 300),
+}
+
+# Load balancers/reverse proxies (IPs or CIDR ranges) whose
+# X-Forwarded-For header is trusted for the client address.
+TRUSTED_PROXIES = [
+    proxy.strip() for proxy in os.environ.get("TRUSTED_PROXIES", "").split(",") if proxy.strip()
+]
+
+# Size of the thread pool PBKDF2 hashing runs in; 0 hashes inline.
+AUTH_HASHER_WORKERS = 4
+
 # Internationalization
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
@@ -93,11 +140,20 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, "static"),  # Default static directory
-    os.path.join(BASE_DIR, "Ecommerce/static"),
-    # '/home/harikrushn/Downloads/project/blog_templates/static',
-    # '/home/harikrushn/Downloads/project/blog_templates/blog_templates/static',
 ]
 
+# collectstatic minifies, hashes and precompresses (gzip + brotli) every
+# asset; ecom.asgi.ASGIStaticFiles serves hashed files with immutable cache
+# headers.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "ecom.storage.OptimizedStaticFilesStorage",
+    },
+}
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
@@ -105,7 +161,3 @@ EXTERNAL_IMAGES_DIR = os.path.join(BASE_DIR, "profile_images")
 EXTERNAL_IMAGES_URL = "/profile_images/"
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
-
-STATICFILES_DIRS = [
-    os.path.join(BASE_DIR, "static"),
-]
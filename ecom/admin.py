@@ -1,7 +1,20 @@
 from django.contrib import admin
-from .models import Product, About, Contact
+from .models import Product, About, Contact, SalesRollup
 
 # Register your models here.
 admin.site.register(Product)
 admin.site.register(About)
 admin.site.register(Contact)
+
+
+@admin.register(SalesRollup)
+class SalesRollupAdmin(admin.ModelAdmin):
+    list_display = ("bucket", "period", "product", "revenue", "units", "orders")
+    list_filter = ("period",)
+    list_select_related = ("product",)
+    date_hierarchy = "bucket"
+    # Rollups are maintained by checkout and rebuild_sales_rollups only.
+    readonly_fields = ("period", "bucket", "product", "revenue", "units", "orders")
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,61 @@
+import asyncio
+
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+CHUNK_SIZE = 64 * 1024
+
+class ASGIStaticFiles:
+    """
+    Serve STATIC_ROOT in front of the Django ASGI application.
+
+    WhiteNoiseMiddleware is sync-only, and a single sync middleware makes
+    Django run every request in a thread. This wrapper keeps WhiteNoise's file
+    index, compression negotiation and immutable cache headers but answers
+    outside the middleware chain, so the views stay on the event loop. File
+    reads are handed to a thread a chunk at a time.
+    """
+
+    def __init__(self, application):
+        self.application = application
+        # Only the file index and settings handling are used; the middleware
+        # itself is never placed in the request chain.
+        self.whitenoise = WhiteNoiseMiddleware()
+
+    async def __call__(self, scope, receive, send):
+        static_file = None
+        if scope["type"] == "http" and scope["path"].startswith(self.whitenoise.static_prefix):
+            static_file = await self.find_file(scope["path"])
+        if static_file is None:
+            return await self.application(scope, receive, send)
+        await self.serve(static_file, scope, send)
+
+    async def find_file(self, path):
+        if self.whitenoise.autorefresh:
+            return await asyncio.to_thread(self.whitenoise.find_file, path)
+        return self.whitenoise.files.get(path)
+
+    async def serve(self, static_file, scope, send):
+        request_headers = {
+            "HTTP_" + name.decode("latin-1").upper().replace("-", "_"): value.decode("latin-1")
+            for name, value in scope["headers"]
+        }
+        response = await asyncio.to_thread(
+            static_file.get_response, scope["method"], request_headers
+        )
+        await send({
+            "type": "http.response.start",
+            "status": int(response.status),
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in response.headers
+            ],
+        })
+        if response.file is None:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        try:
+            while chunk := await asyncio.to_thread(response.file.read, CHUNK_SIZE):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            response.file.close()
@@ -0,0 +1,99 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Sum
+from .models import CartItem, Product
+
+CATALOG_VERSION_KEY = "catalog:version"
+CATALOG_TIMEOUT = 300
+CATALOG_LIMIT = 50
+
+def catalog_key(version, query):
+    # Search strings are user input; hash them into a memcached-safe key.
+    digest = hashlib.md5(query.encode("utf-8")).hexdigest()
+    return f"catalog:{version}:products:{digest}"
+
+def catalog_queryset(query):
+    queryset = Product.objects.order_by("id")
+    if query:
+        queryset = queryset.filter(product_name__icontains=query)
+    return queryset[:CATALOG_LIMIT]
+
+def product_summary(product):
+    return {
+        "id": product.id,
+        "product_name": product.product_name,
+        "price": str(product.price),
+        "image": product.image.url if product.image else "",
+    }
+
+def get_catalog_version():
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        version = 1
+        cache.add(CATALOG_VERSION_KEY, version, None)
+    return version
+
+async def aget_catalog_version():
+    version = await cache.aget(CATALOG_VERSION_KEY)
+    if version is None:
+        version = 1
+        await cache.aadd(CATALOG_VERSION_KEY, version, None)
+    return version
+
+def bump_catalog_version():
+    # Old entries are never deleted, they simply stop being addressed and expire.
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, 2, None)
+
+CART_COUNT_TIMEOUT = 60 * 60 * 24
+
+def cart_count_key(user_id):
+    return f"cart:{user_id}:count"
+
+def _cart_count_query(user_id):
+    return CartItem.objects.filter(cart__user_id=user_id)
+
+def get_cart_count(user_id):
+    key = cart_count_key(user_id)
+    count = cache.get(key)
+    if count is None:
+        totals = _cart_count_query(user_id).aggregate(count=Sum("quantity"))
+        count = totals["count"] or 0
+        cache.set(key, count, CART_COUNT_TIMEOUT)
+    return count
+
+async def aget_cart_count(user_id):
+    key = cart_count_key(user_id)
+    count = await cache.aget(key)
+    if count is None:
+        totals = await _cart_count_query(user_id).aaggregate(count=Sum("quantity"))
+        count = totals["count"] or 0
+        await cache.aset(key, count, CART_COUNT_TIMEOUT)
+    return count
+
+# The counters below are adjusted in place. If the entry has expired there is
+# nothing to adjust; the next read recomputes it from the database.
+def adjust_cart_count(user_id, delta):
+    if delta:
+        try:
+            cache.incr(cart_count_key(user_id), delta)
+        except ValueError:
+            pass
+
+async def aadjust_cart_count(user_id, delta):
+    if delta:
+        try:
+            await cache.aincr(cart_count_key(user_id), delta)
+        except ValueError:
+            pass
+
+def reset_cart_count(user_id, count=0):
+    cache.set(cart_count_key(user_id), count, CART_COUNT_TIMEOUT)
+
+PRODUCT_PAGE_TIMEOUT = 60 * 60 * 24
+
+def product_page_key(product_id):
+    return f"product:{product_id}:page"
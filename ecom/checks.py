@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.checks import Error, register
+from django.utils.module_loading import import_string
+
+@register()
+def check_async_middleware(app_configs, **kwargs):
+    # One sync-only middleware makes Django run every request in a thread
+    # under ASGI, which defeats the async views. Static files are served by
+    # ecom.asgi.ASGIStaticFiles instead of a middleware for this reason.
+    errors = []
+    for path in settings.MIDDLEWARE:
+        try:
+            middleware = import_string(path)
+        except ImportError:
+            continue  # Django reports unimportable middleware itself.
+        if not getattr(middleware, "async_capable", False):
+            errors.append(
+                Error(
+                    f"{path} is not async-capable.",
+                    hint="Use an async-capable middleware, or move the work out of "
+                    "MIDDLEWARE (see ecom.asgi).",
+                    obj=path,
+                    id="ecom.E001",
+                )
+            )
+    return errors
@@ -0,0 +1,7 @@
+from .cache import get_cart_count
+
+def cart_item_count(request):
+    user_id = request.session.get("user_id")
+    if not user_id:
+        return {"cart_item_count": 0}
+    return {"cart_item_count": get_cart_count(user_id)}
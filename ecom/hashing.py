@@ -0,0 +1,29 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+
+_executor = None
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.AUTH_HASHER_WORKERS,
+            thread_name_prefix="password-hasher",
+        )
+    return _executor
+
+async def _run(func, *args):
+    # With AUTH_HASHER_WORKERS = 0 hashing runs inline, as it did before.
+    if not settings.AUTH_HASHER_WORKERS:
+        return func(*args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), func, *args)
+
+async def acheck_password(password, encoded):
+    return await _run(check_password, password, encoded)
+
+async def amake_password(password):
+    return await _run(make_password, password)
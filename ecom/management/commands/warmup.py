@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ecom.warmup import warm_up
+
+class Command(BaseCommand):
+    help = "Compile templates, resolve URLs, open DB connections and prime the catalog cache."
+
+    def handle(self, *args, **options):
+        try:
+            state = warm_up()
+        except Exception as exc:
+            raise CommandError(f"Warm-up failed: {exc}") from exc
+
+        for name, seconds in state["steps"].items():
+            self.stdout.write(f"{name}: {seconds * 1000:.1f} ms")
+        self.stdout.write(self.style.SUCCESS(f"Warm-up finished in {state['warmup_seconds'] * 1000:.1f} ms"))
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ecom', '0003_rename_pin_code_checkout_pincode'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SalesRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('hour', 'Hour'), ('day', 'Day')], max_length=4)),
+                ('bucket', models.DateTimeField()),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('units', models.PositiveIntegerField(default=0)),
+                ('orders', models.PositiveIntegerField(default=0)),
+                ('product', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='sales_rollups', to='ecom.product')),
+            ],
+            options={
+                'ordering': ['-bucket'],
+                'constraints': [models.UniqueConstraint(fields=('period', 'bucket', 'product'), name='unique_product_sales_rollup'), models.UniqueConstraint(condition=models.Q(('product__isnull', True)), fields=('period', 'bucket'), name='unique_total_sales_rollup')],
+            },
+        ),
+    ]
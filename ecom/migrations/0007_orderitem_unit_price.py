@@ -0,0 +1,28 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_unit_price(apps, schema_editor):
+    # Past prices were never stored; the current price is the best record left.
+    OrderItem = apps.get_model('ecom', 'OrderItem')
+    Product = apps.get_model('ecom', 'Product')
+    OrderItem.objects.update(
+        unit_price=Subquery(Product.objects.filter(pk=OuterRef('product_id')).values('price')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ecom', '0006_product_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderitem',
+            name='unit_price',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_unit_price, migrations.RunPython.noop),
+    ]
@@ -12,6 +12,7 @@ class Product(models.Model):
     description = models.TextField()
     price = models.DecimalField(max_digits=10, decimal_places=2)
     image = models.ImageField(upload_to=get_image_upload_to)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return self.product_name
@@ -105,6 +106,12 @@ class Order(models.Model):
     # )
     total_price = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
 
+    class Meta:
+        indexes = [
+            # Serves the keyset-paginated order history of a single user.
+            models.Index(fields=["user", "-created_at", "-id"], name="order_user_created_idx"),
+        ]
+
     def __str__(self):
         return f"Order #{self.id} by {self.user.name}"
 
@@ -116,12 +123,14 @@ class OrderItem(models.Model):
     order = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="order_items")
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
     quantity = models.PositiveIntegerField(default=1)
+    # The product's price at checkout; later price edits don't change the order.
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
 
     def __str__(self):
         return f"{self.quantity} x {self.product.product_name} (Order #{self.order.id})"
 
     def total_price(self):
-        return self.quantity * self.product.price
+        return self.quantity * self.unit_price
 
 class BillingAddress(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="billing_addresses")
@@ -138,3 +147,39 @@ class BillingAddress(models.Model):
 
     def full_address(self):
         return f"{self.address}, {self.city}, {self.state}, {self.pincode}, {self.country}"
+
+class SalesRollup(models.Model):
+    PERIOD_HOUR = "hour"
+    PERIOD_DAY = "day"
+    PERIOD_CHOICES = [
+        (PERIOD_HOUR, "Hour"),
+        (PERIOD_DAY, "Day"),
+    ]
+
+    period = models.CharField(max_length=4, choices=PERIOD_CHOICES)
+    bucket = models.DateTimeField()
+    # Rows without a product hold the totals across all products.
+    product = models.ForeignKey(
+        Product, on_delete=models.CASCADE, related_name="sales_rollups", blank=True, null=True
+    )
+    revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    units = models.PositiveIntegerField(default=0)
+    orders = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ["-bucket"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["period", "bucket", "product"],
+                name="unique_product_sales_rollup",
+            ),
+            models.UniqueConstraint(
+                fields=["period", "bucket"],
+                condition=models.Q(product__isnull=True),
+                name="unique_total_sales_rollup",
+            ),
+        ]
+
+    def __str__(self):
+        target = self.product.product_name if self.product else "All products"
+        return f"{target} - {self.get_period_display()} of {self.bucket:%Y-%m-%d %H:%M}"
@@ -0,0 +1,65 @@
+import hashlib
+import ipaddress
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+def _window_key(scope, kind, ident, window_index):
+    digest = hashlib.md5(ident.encode("utf-8")).hexdigest()
+    return f"rl:{scope}:{kind}:{digest}:{window_index}"
+
+async def ahit(scope, kind, ident, limit, window):
+    """
+    Record one attempt and return True if it is over the limit.
+
+    Uses a sliding window counter: the count of the current fixed window plus
+    the previous window's count weighted by how much of it still overlaps the
+    last ``window`` seconds. Two cache keys per identity, no per-hit storage.
+    """
+    now = time.time()
+    current = int(now // window)
+    overlap = 1 - (now % window) / window
+
+    key = _window_key(scope, kind, ident, current)
+    if await cache.aadd(key, 1, window * 2):
+        count = 1
+    else:
+        try:
+            count = await cache.aincr(key)
+        except ValueError:
+            await cache.aset(key, 1, window * 2)
+            count = 1
+    previous = await cache.aget(_window_key(scope, kind, ident, current - 1), 0)
+
+    return previous * overlap + count > limit
+
+def _is_trusted_proxy(address):
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in ipaddress.ip_network(proxy) for proxy in settings.TRUSTED_PROXIES)
+
+def client_ip(request):
+    """
+    The address of the client, looking through X-Forwarded-For only when the
+    request came from one of TRUSTED_PROXIES. Hops are read from the nearest
+    one outwards and the first address that is not our own proxy wins, so a
+    client cannot spoof its address by sending the header itself.
+    """
+    remote = request.META.get("REMOTE_ADDR", "")
+    if not _is_trusted_proxy(remote):
+        return remote
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    for address in reversed([hop.strip() for hop in forwarded.split(",") if hop.strip()]):
+        if not _is_trusted_proxy(address):
+            return address
+    return remote
+
+async def ais_rate_limited(scope, request, email):
+    """Check both the per-IP and the per-email budget for ``scope``."""
+    limits = settings.AUTH_RATE_LIMITS
+    ip_limited = await ahit(scope, "ip", client_ip(request), *limits["ip"])
+    email_limited = await ahit(scope, "email", email.strip().lower(), *limits["email"])
+    return ip_limited or email_limited
@@ -0,0 +1,92 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, DecimalField, F, Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from .models import Order, OrderItem, SalesRollup
+
+def _day(hour):
+    return timezone.localtime(hour).replace(hour=0)
+
+def compute_deltas(order_ids):
+    """
+    Aggregate the given orders into rollup increments.
+
+    Returns ``{(period, bucket, product_id): [revenue, units, orders]}`` where a
+    ``product_id`` of None is the total across products. Every order falls in
+    exactly one hour, so day rows are the sum of their hour rows.
+    """
+    deltas = defaultdict(lambda: [Decimal("0"), 0, 0])
+
+    def add(hour, product_id, revenue, units, orders):
+        for key in (
+            (SalesRollup.PERIOD_HOUR, hour, product_id),
+            (SalesRollup.PERIOD_DAY, _day(hour), product_id),
+        ):
+            row = deltas[key]
+            row[0] += revenue
+            row[1] += units
+            row[2] += orders
+
+    lines = (
+        OrderItem.objects.filter(order_id__in=order_ids)
+        .annotate(hour=TruncHour("order__created_at"))
+        .values("hour", "product_id")
+        .annotate(
+            revenue=Sum(
+                F("quantity") * F("unit_price"),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+            units=Sum("quantity"),
+            orders=Count("order_id", distinct=True),
+        )
+    )
+    for line in lines:
+        add(line["hour"], line["product_id"], line["revenue"] or 0, line["units"], line["orders"])
+        add(line["hour"], None, line["revenue"] or 0, line["units"], 0)
+
+    order_counts = (
+        Order.objects.filter(id__in=order_ids)
+        .annotate(hour=TruncHour("created_at"))
+        .values("hour")
+        .annotate(orders=Count("id"))
+    )
+    for row in order_counts:
+        add(row["hour"], None, 0, 0, row["orders"])
+
+    return deltas
+
+def _apply_one(period, bucket, product_id, revenue, units, orders):
+    rows = SalesRollup.objects.filter(period=period, bucket=bucket, product_id=product_id)
+    increments = {
+        "revenue": F("revenue") + revenue,
+        "units": F("units") + units,
+        "orders": F("orders") + orders,
+    }
+    if rows.update(**increments):
+        return
+    try:
+        with transaction.atomic():
+            SalesRollup.objects.create(
+                period=period,
+                bucket=bucket,
+                product_id=product_id,
+                revenue=revenue,
+                units=units,
+                orders=orders,
+            )
+    except IntegrityError:
+        # Another transaction created the row first.
+        rows.update(**increments)
+
+@transaction.atomic
+def apply_deltas(deltas):
+    for (period, bucket, product_id), (revenue, units, orders) in deltas.items():
+        _apply_one(period, bucket, product_id, revenue, units, orders)
+
+def record_order(order):
+    """Fold a finalized order into the hourly and daily rollups."""
+    apply_deltas(compute_deltas([order.id]))
@@ -0,0 +1,21 @@
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_catalog_version, product_page_key
+from .models import Product
+
+def _drop_product_caches(product_id):
+    # CACHES is the shared Redis backend, so this reaches every worker.
+    cache.delete(product_page_key(product_id))
+    bump_catalog_version()
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product_caches(sender, instance, **kwargs):
+    # Wait for the commit so another worker can't re-cache the old row
+    # between the delete and the commit.
+    transaction.on_commit(partial(_drop_product_caches, instance.pk))
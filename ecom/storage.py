@@ -0,0 +1,73 @@
+import io
+import os
+
+from django.core.files.base import ContentFile
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+try:
+    import rcssmin
+except ImportError:  # pragma: no cover - minification is optional
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:  # pragma: no cover - minification is optional
+    rjsmin = None
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - recompression is optional
+    Image = None
+
+JPEG_QUALITY = 85
+
+def minify_css(data):
+    if rcssmin is None:
+        return data
+    return rcssmin.cssmin(data.decode("utf-8")).encode("utf-8")
+
+def minify_js(data):
+    if rjsmin is None:
+        return data
+    return rjsmin.jsmin(data.decode("utf-8")).encode("utf-8")
+
+def recompress_image(data, image_format):
+    if Image is None:
+        return data
+    try:
+        image = Image.open(io.BytesIO(data))
+        output = io.BytesIO()
+        if image_format == "JPEG":
+            image.save(output, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+        else:
+            image.save(output, "PNG", optimize=True)
+    except (OSError, ValueError):
+        return data
+    # Never replace an asset with a larger one.
+    return output.getvalue() if output.tell() < len(data) else data
+
+OPTIMIZERS = {
+    ".css": minify_css,
+    ".js": minify_js,
+    ".jpg": lambda data: recompress_image(data, "JPEG"),
+    ".jpeg": lambda data: recompress_image(data, "JPEG"),
+    ".png": lambda data: recompress_image(data, "PNG"),
+}
+
+class OptimizedStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Manifest storage that minifies CSS/JS and recompresses images as they are
+    written to STATIC_ROOT. WhiteNoise then writes the .gz and .br variants;
+    ecom.asgi.ASGIStaticFiles serves hashed names with far-future
+    ``immutable`` cache headers.
+
+    Every copy Django writes (original and hashed names) is produced from the
+    source file, so each asset is optimized exactly once per copy.
+    """
+
+    def _save(self, name, content):
+        optimizer = OPTIMIZERS.get(os.path.splitext(name)[1].lower())
+        if optimizer is not None and ".min." not in os.path.basename(name):
+            content.seek(0)
+            content = ContentFile(optimizer(content.read()))
+        return super()._save(name, content)
@@ -1,3 +1,546 @@
-from django.test import TestCase
+import gzip
+import json
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock, skipIf
 
-# Create your tests here.
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db.models import F, Sum
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+
+from .cache import CATALOG_LIMIT, get_cart_count, product_page_key
+from .models import Cart, CartItem, Order, Product, SalesRollup, User
+from .ratelimit import client_ip
+from .reporting import compute_deltas
+from . import storage, views, warmup
+from .asgi import ASGIStaticFiles
+from .checks import check_async_middleware
+
+# The suite runs without Redis or collectstatic: each test gets a fresh
+# in-process cache and unhashed static URLs.
+LOCMEM_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "furni-tests",
+    }
+}
+PLAIN_STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+CHECKOUT_DATA = {
+    "fullname": "Asha",
+    "street_address": "1 Main Road",
+    "city": "Surat",
+    "state": "Gujarat",
+    "pin_code": "395001",
+    "country": "India",
+    "contact_number": "9999999999",
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES, STORAGES=PLAIN_STORAGES)
+class ShopTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(
+            name="Asha", email="asha@example.com", phone="9999999999", password="x", age=30
+        )
+        self.chair = Product.objects.create(
+            product_name="Chair", description="Oak chair", price="10.00", image="chair.png"
+        )
+        self.sofa = Product.objects.create(
+            product_name="Sofa", description="Three seater", price="100.00", image="sofa.png"
+        )
+
+    def log_in(self):
+        session = self.client.session
+        session["user_id"] = self.user.id
+        session["user_name"] = self.user.name
+        session.save()
+
+    def add_to_cart(self, product, quantity):
+        self.client.post("/cart/add/", {"product_id": product.id, "quantity": quantity})
+
+
+class ProductsJsonTests(ShopTestCase):
+    def names(self, query=""):
+        response = self.client.get("/products/json/", {"q": query})
+        return [product["product_name"] for product in response.json()["products"]]
+
+    def test_search_filters_by_name(self):
+        self.assertEqual(self.names(), ["Chair", "Sofa"])
+        self.assertEqual(self.names("  CHA "), ["Chair"])
+        self.assertEqual(self.names("table"), [])
+
+    def test_results_capped(self):
+        Product.objects.bulk_create(
+            Product(product_name=f"Stool {n}", description="", price="5.00", image="stool.png")
+            for n in range(CATALOG_LIMIT)
+        )
+        self.assertEqual(len(self.names()), CATALOG_LIMIT)
+
+    def test_repeat_search_served_from_cache(self):
+        self.names("chair")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.names("chair"), ["Chair"])
+
+    def test_product_save_invalidates_results(self):
+        self.assertEqual(self.names("chair"), ["Chair"])
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chair.product_name = "Armchair"
+            self.chair.save()
+        self.assertEqual(self.names("chair"), ["Armchair"])
+
+
+class AsyncCartTests(ShopTestCase):
+    def update(self, item, quantity):
+        return self.client.post(
+            "/update-cart/",
+            json.dumps({"item_id": item.id, "quantity": quantity}),
+            content_type="application/json",
+        )
+
+    def test_update_returns_totals(self):
+        self.log_in()
+        self.add_to_cart(self.chair, 1)
+        self.add_to_cart(self.sofa, 1)
+        response = self.update(CartItem.objects.get(product=self.chair), 3)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(float(data["item_total_price"]), 30)
+        self.assertEqual(float(data["cart_total_price"]), 130)
+
+    def test_cannot_update_other_users_items(self):
+        other = User.objects.create(name="Ravi", email="ravi@example.com", phone="1", password="x", age=40)
+        item = CartItem.objects.create(cart=Cart.objects.create(user=other), product=self.chair, quantity=1)
+        self.log_in()
+        self.assertEqual(self.update(item, 9).status_code, 404)
+        item.refresh_from_db()
+        self.assertEqual(item.quantity, 1)
+
+    def test_cart_count(self):
+        self.assertRedirects(self.client.get("/cart/count/"), "/login/", fetch_redirect_response=False)
+        self.log_in()
+        self.add_to_cart(self.chair, 2)
+        self.assertEqual(self.client.get("/cart/count/").json(), {"count": 2})
+
+
+class CartCountTests(ShopTestCase):
+    def db_count(self):
+        return CartItem.objects.filter(cart__user=self.user).aggregate(n=Sum("quantity"))["n"] or 0
+
+    def test_counter_matches_database(self):
+        self.log_in()
+        self.assertEqual(get_cart_count(self.user.id), 0)
+
+        self.add_to_cart(self.chair, 2)
+        self.add_to_cart(self.sofa, 1)
+        self.assertEqual(get_cart_count(self.user.id), self.db_count())
+
+        item = CartItem.objects.get(product=self.chair)
+        self.client.post(
+            "/update-cart/",
+            json.dumps({"item_id": item.id, "quantity": 5}),
+            content_type="application/json",
+        )
+        self.assertEqual(get_cart_count(self.user.id), self.db_count())
+
+        self.client.post("/cart/remove/", {"item_id": item.id})
+        self.assertEqual(get_cart_count(self.user.id), self.db_count())
+
+        self.client.post("/checkout/", CHECKOUT_DATA)
+        self.assertEqual(self.db_count(), 0)
+        self.assertEqual(get_cart_count(self.user.id), 0)
+
+    def test_badge_rendered_from_counter(self):
+        self.log_in()
+        self.add_to_cart(self.chair, 3)
+        response = self.client.get("/shop/")
+        self.assertContains(response, '<span class="cart-item-count">3</span>', html=True)
+
+    def test_cannot_remove_other_users_items(self):
+        other = User.objects.create(name="Ravi", email="ravi@example.com", phone="1", password="x", age=40)
+        item = CartItem.objects.create(cart=Cart.objects.create(user=other), product=self.chair, quantity=1)
+        self.log_in()
+        self.client.post("/cart/remove/", {"item_id": item.id})
+        self.assertTrue(CartItem.objects.filter(id=item.id).exists())
+
+
+@override_settings(AUTH_RATE_LIMITS={"ip": (100, 60), "email": (3, 60)})
+class LoginRateLimitTests(ShopTestCase):
+    def test_limit_trips_before_hashing(self):
+        with mock.patch("ecom.views.acheck_password", new_callable=mock.AsyncMock) as check:
+            check.return_value = False
+            for _ in range(3):
+                response = self.client.post("/login/", {"email": self.user.email, "password": "bad"})
+                self.assertEqual(response.status_code, 200)
+            self.assertEqual(check.await_count, 3)
+
+            response = self.client.post("/login/", {"email": self.user.email, "password": "bad"})
+            self.assertEqual(response.status_code, 429)
+            self.assertEqual(check.await_count, 3)
+
+    def test_register_limited_before_hashing(self):
+        data = {"name": "Bob", "phone": "1", "password": "pw", "gender": "Male", "age": "20"}
+        with mock.patch("ecom.views.amake_password", new_callable=mock.AsyncMock) as make:
+            make.return_value = "pbkdf2_sha256$hashed"
+            for _ in range(3):
+                self.client.post("/register/", {**data, "email": "bob@example.com"})
+            response = self.client.post("/register/", {**data, "email": "bob@example.com"})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(make.await_count, 1)
+
+    @override_settings(AUTH_RATE_LIMITS={"ip": (2, 60), "email": (100, 60)})
+    def test_ip_limit_applies_across_emails(self):
+        for index in range(2):
+            self.client.post("/login/", {"email": f"u{index}@example.com", "password": "bad"})
+        response = self.client.post("/login/", {"email": "u9@example.com", "password": "bad"})
+        self.assertEqual(response.status_code, 429)
+
+
+class ClientIpTests(SimpleTestCase):
+    factory = RequestFactory()
+
+    def request(self, remote, forwarded=None):
+        meta = {"REMOTE_ADDR": remote}
+        if forwarded:
+            meta["HTTP_X_FORWARDED_FOR"] = forwarded
+        return self.factory.get("/", **meta)
+
+    @override_settings(TRUSTED_PROXIES=[])
+    def test_header_ignored_without_trusted_proxies(self):
+        self.assertEqual(client_ip(self.request("203.0.113.5", "1.2.3.4")), "203.0.113.5")
+
+    @override_settings(TRUSTED_PROXIES=["10.0.0.0/8"])
+    def test_forwarded_address_behind_trusted_proxy(self):
+        request = self.request("10.0.0.2", "1.2.3.4, 198.51.100.7, 10.0.0.9")
+        self.assertEqual(client_ip(request), "198.51.100.7")
+
+    @override_settings(TRUSTED_PROXIES=["10.0.0.0/8"])
+    def test_untrusted_peer_cannot_spoof(self):
+        self.assertEqual(client_ip(self.request("198.51.100.7", "1.2.3.4")), "198.51.100.7")
+
+
+class CheckoutTests(ShopTestCase):
+    def test_failed_rollup_rolls_back_order(self):
+        self.log_in()
+        self.add_to_cart(self.chair, 2)
+        with mock.patch("ecom.views.record_order", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.post("/checkout/", CHECKOUT_DATA)
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual(CartItem.objects.get().quantity, 2)
+
+
+class SalesRollupTests(ShopTestCase):
+    def rollups(self):
+        return sorted(
+            SalesRollup.objects.values_list("period", "bucket", "product_id", "revenue", "units", "orders"),
+            key=lambda row: (row[0], row[1], row[2] or 0),
+        )
+
+    def place_orders(self):
+        self.log_in()
+        self.add_to_cart(self.chair, 2)
+        self.add_to_cart(self.sofa, 1)
+        self.client.post("/checkout/", CHECKOUT_DATA)
+        self.add_to_cart(self.chair, 1)
+        self.client.post("/checkout/", CHECKOUT_DATA)
+
+    def move_to_yesterday(self):
+        # The rebuild only covers closed days.
+        Order.objects.update(created_at=F("created_at") - timedelta(days=1))
+        SalesRollup.objects.update(bucket=F("bucket") - timedelta(days=1))
+
+    def test_checkout_rollups_match_rebuild(self):
+        self.place_orders()
+        self.move_to_yesterday()
+        incremental = self.rollups()
+        call_command("rebuild_sales_rollups", "--chunk-size", "1", stdout=StringIO())
+        self.assertEqual(self.rollups(), incremental)
+
+    def test_rebuild_keeps_checkout_prices(self):
+        self.place_orders()
+        self.move_to_yesterday()
+        incremental = self.rollups()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chair.price = "15.00"
+            self.chair.save()
+        call_command("rebuild_sales_rollups", stdout=StringIO())
+        self.assertEqual(self.rollups(), incremental)
+
+    def test_totals(self):
+        self.place_orders()
+        day_total = SalesRollup.objects.get(period=SalesRollup.PERIOD_DAY, product=None)
+        self.assertEqual((day_total.revenue, day_total.units, day_total.orders), (130, 4, 2))
+        chair = SalesRollup.objects.get(period=SalesRollup.PERIOD_DAY, product=self.chair)
+        self.assertEqual((chair.revenue, chair.units, chair.orders), (30, 3, 2))
+
+    def test_rebuild_leaves_todays_checkouts_alone(self):
+        self.place_orders()
+        self.move_to_yesterday()
+        real_compute = compute_deltas
+        placed = []
+
+        def compute_and_place_order(order_ids):
+            # An order checked out mid-rebuild lands today, which only
+            # checkout writes to.
+            if not placed:
+                self.add_to_cart(self.sofa, 1)
+                self.client.post("/checkout/", CHECKOUT_DATA)
+                placed.append(True)
+            return real_compute(order_ids)
+
+        with mock.patch(
+            "ecom.management.commands.rebuild_sales_rollups.compute_deltas",
+            side_effect=compute_and_place_order,
+        ):
+            call_command("rebuild_sales_rollups", stdout=StringIO())
+
+        sofa = SalesRollup.objects.filter(period=SalesRollup.PERIOD_DAY, product=self.sofa)
+        self.assertEqual(list(sofa.order_by("bucket").values_list("units", flat=True)), [1, 1])
+
+    def test_rebuild_spans_days(self):
+        self.place_orders()
+        self.move_to_yesterday()
+        first = Order.objects.earliest("id")
+        Order.objects.filter(id=first.id).update(created_at=first.created_at - timedelta(days=2))
+        stale = SalesRollup.objects.create(
+            period=SalesRollup.PERIOD_DAY, bucket=first.created_at - timedelta(days=5), units=7
+        )
+
+        call_command("rebuild_sales_rollups", stdout=StringIO())
+
+        self.assertFalse(SalesRollup.objects.filter(id=stale.id).exists())
+        days = SalesRollup.objects.filter(period=SalesRollup.PERIOD_DAY, product=None).order_by("bucket")
+        self.assertEqual([(day.revenue, day.units, day.orders) for day in days], [(120, 3, 1), (10, 1, 1)])
+
+
+class OrderHistoryTests(ShopTestCase):
+    def setUp(self):
+        super().setUp()
+        orders = [Order.objects.create(user=self.user, total_price=10) for _ in range(45)]
+        # Force ties on created_at so pages must be split by id.
+        Order.objects.filter(id__in=[order.id for order in orders[:25]]).update(
+            created_at=orders[0].created_at
+        )
+        self.log_in()
+
+    def page_ids(self, response):
+        return [order.id for order in response.context["orders"]]
+
+    def test_pages_cover_every_order_once(self):
+        seen = []
+        url = "/orders/"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            seen += self.page_ids(response)
+            cursor = response.context["next_cursor"]
+            url = f"/orders/?before={cursor}" if cursor else None
+
+        expected = list(
+            Order.objects.filter(user=self.user).order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+
+    def test_page_query_count_is_bounded(self):
+        first = self.client.get("/orders/")
+        cursor = first.context["next_cursor"]
+        # session, orders, prefetched items.
+        with self.assertNumQueries(3):
+            self.client.get(f"/orders/?before={cursor}")
+
+    def test_bad_cursor_shows_first_page(self):
+        first_page = self.page_ids(self.client.get("/orders/"))
+        for cursor in ["junk", "1-2-3", "-5-1", "5--1", "99999999999999999999-1", "1-0"]:
+            response = self.client.get("/orders/", {"before": cursor})
+            self.assertEqual(response.status_code, 200, cursor)
+            self.assertEqual(self.page_ids(response), first_page, cursor)
+
+
+class ReadinessTests(ShopTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(warmup.state, {"ready": False, "steps": {}, "error": None})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_ready_until_warmed_up(self):
+        with mock.patch("ecom.views.start_warm_up") as start:
+            response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 503)
+        start.assert_called_once()
+
+        warmup.warm_up()
+        response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.json()["steps"]), {"urlconf", "templates", "database", "caches"})
+
+    def test_lost_database_reports_not_ready(self):
+        warmup.warm_up()
+        with mock.patch("ecom.views.check_database", side_effect=Exception("connection refused")):
+            response = self.client.get("/readyz")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()["error"], "connection refused")
+
+    def test_warm_up_closes_its_connections(self):
+        with mock.patch("ecom.warmup.connections.close_all") as close_all:
+            warmup.run_warm_up()
+            with mock.patch("ecom.warmup.warm_up", side_effect=RuntimeError):
+                with self.assertRaises(RuntimeError):
+                    warmup.run_warm_up()
+        self.assertEqual(close_all.call_count, 2)
+
+    def test_healthz(self):
+        self.assertEqual(self.client.get("/healthz").status_code, 200)
+
+
+class ProductPageValidatorTests(ShopTestCase):
+    def get(self, etag=None):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        return self.client.get(f"/product/{self.chair.id}/", **headers)
+
+    def test_unchanged_page_is_not_modified(self):
+        first = self.get()
+        self.assertEqual(first.status_code, 200)
+        self.assertNotIn("Last-Modified", first)
+        self.assertEqual(self.get(first["ETag"]).status_code, 304)
+
+    def test_page_fetched_once_per_request(self):
+        with mock.patch("ecom.views.get_product_page", wraps=views.get_product_page) as get_page:
+            self.assertEqual(self.get().status_code, 200)
+        get_page.assert_called_once_with(self.chair.id)
+
+    def test_product_change_returns_full_page(self):
+        etag = self.get()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.chair.price = "12.00"
+            self.chair.save()
+        self.assertEqual(self.get(etag).status_code, 200)
+
+    def test_cached_page_kept_until_commit(self):
+        self.get()
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.chair.save()
+        self.assertIsNotNone(cache.get(product_page_key(self.chair.id)))
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(cache.get(product_page_key(self.chair.id)))
+
+    def test_login_returns_full_page(self):
+        etag = self.get()["ETag"]
+        self.log_in()
+        self.assertEqual(self.get(etag).status_code, 200)
+
+    def test_cart_change_returns_full_page(self):
+        self.log_in()
+        etag = self.get()["ETag"]
+        self.add_to_cart(self.sofa, 1)
+        response = self.get(etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '<span class="cart-item-count">1</span>')
+
+
+class AsyncMiddlewareCheckTests(SimpleTestCase):
+    def test_configured_middleware_is_async_capable(self):
+        self.assertEqual(check_async_middleware(None), [])
+
+    def test_sync_only_middleware_reported(self):
+        middleware = settings.MIDDLEWARE + ["whitenoise.middleware.WhiteNoiseMiddleware"]
+        with self.settings(MIDDLEWARE=middleware):
+            errors = check_async_middleware(None)
+        self.assertEqual([error.id for error in errors], ["ecom.E001"])
+
+
+class ASGIStaticFilesTests(SimpleTestCase):
+    CSS = b"body { color: red; }\n" * 100
+
+    def setUp(self):
+        root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, root)
+        (root / "css").mkdir()
+        (root / "css" / "style.css").write_bytes(self.CSS)
+        (root / "css" / "style.css.gz").write_bytes(gzip.compress(self.CSS))
+        override = self.settings(STATIC_ROOT=str(root), STATIC_URL="/static/")
+        override.enable()
+        self.addCleanup(override.disable)
+
+    async def fetch(self, path, headers=()):
+        async def application(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"django"})
+
+        messages = []
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "path": path, "headers": list(headers)}
+        await ASGIStaticFiles(application)(scope, None, send)
+        status = messages[0]["status"]
+        response_headers = dict(messages[0]["headers"])
+        body = b"".join(message.get("body", b"") for message in messages[1:])
+        return status, response_headers, body
+
+    async def test_serves_static_files(self):
+        status, headers, body = await self.fetch("/static/css/style.css")
+        self.assertEqual(status, 200)
+        self.assertEqual(headers[b"content-type"], b"text/css; charset=\"utf-8\"")
+        self.assertEqual(body, self.CSS)
+
+    async def test_serves_compressed_variant(self):
+        status, headers, body = await self.fetch(
+            "/static/css/style.css", [(b"accept-encoding", b"gzip")]
+        )
+        self.assertEqual(headers[b"content-encoding"], b"gzip")
+        self.assertEqual(gzip.decompress(body), self.CSS)
+
+    async def test_passes_other_paths_to_django(self):
+        self.assertEqual(await self.fetch("/shop/"), (200, {}, b"django"))
+        self.assertEqual(await self.fetch("/static/missing.css"), (200, {}, b"django"))
+
+
+@skipIf(storage.rcssmin is None, "rcssmin is not installed")
+class OptimizedStaticFilesStorageTests(SimpleTestCase):
+    STYLE = b"/* theme */\nbody {\n    color: red;\n}\n"
+    VENDOR = b"/* vendor build, keep as shipped */\n.a { color: blue; }\n"
+
+    def setUp(self):
+        source = Path(tempfile.mkdtemp())
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, source)
+        self.addCleanup(shutil.rmtree, self.root)
+        (source / "css").mkdir()
+        (source / "css" / "style.css").write_bytes(self.STYLE)
+        (source / "css" / "vendor.min.css").write_bytes(self.VENDOR)
+        override = self.settings(
+            STATIC_ROOT=str(self.root),
+            STATICFILES_DIRS=[str(source)],
+            STATICFILES_FINDERS=["django.contrib.staticfiles.finders.FileSystemFinder"],
+            STORAGES={
+                **PLAIN_STORAGES,
+                "staticfiles": {"BACKEND": "ecom.storage.OptimizedStaticFilesStorage"},
+            },
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    def test_collectstatic_minifies_and_writes_manifest(self):
+        manifest = json.loads((self.root / "staticfiles.json").read_text())
+        hashed = manifest["paths"]["css/style.css"]
+        self.assertNotEqual(hashed, "css/style.css")
+        for name in ("css/style.css", hashed):
+            self.assertEqual((self.root / name).read_bytes(), b"body{color:red}")
+
+    def test_min_files_copied_unchanged(self):
+        manifest = json.loads((self.root / "staticfiles.json").read_text())
+        self.assertEqual((self.root / manifest["paths"]["css/vendor.min.css"]).read_bytes(), self.VENDOR)
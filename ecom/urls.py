@@ -15,6 +15,8 @@ urlpatterns = [
     # Products
     path("add_product/", views.add_product, name="add_product"),
     path("shop/", views.shop_view, name="shop_view"),
+    path("product/<int:product_id>/", views.product_detail, name="product_detail"),
+    path("products/json/", views.products_json, name="products_json"),
     
     # Contact
     path("contact/", views.contact, name="contact"),
@@ -23,9 +25,17 @@ urlpatterns = [
     path("cart/", views.get_cart, name="cart_view"),
     path('cart/add/', views.add_to_cart, name='add_to_cart'),
     path('update-cart/', views.update_cart, name='update_cart'),
+    path('cart/count/', views.cart_count, name='cart_count'),
     path('cart/remove/', views.remove_cart, name='remove_cart'),
     path('checkout/', views.checkout, name='checkout'),
     path('payment/<int:order_id>/', views.payment_view, name='payment_view'),
+
+    # Orders
+    path("orders/", views.order_history, name="order_history"),
+
+    # Health Checks
+    path("healthz", views.healthz, name="healthz"),
+    path("readyz", views.readyz, name="readyz"),
 ]
 
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
@@ -1,16 +1,35 @@
 from functools import wraps
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.shortcuts import redirect
 
+NEVER_CACHE = 'no-store, no-cache, must-revalidate, max-age=0'
+
 def never_cache_custom(view_func):
+    if iscoroutinefunction(view_func):
+        async def _wrapped_view(request, *args, **kwargs):
+            response = await view_func(request, *args, **kwargs)
+            response['Cache-Control'] = NEVER_CACHE
+            return response
+
+        return markcoroutinefunction(wraps(view_func)(_wrapped_view))
+
     @wraps(view_func)
     def _wrapped_view(request, *args, **kwargs):
         response = view_func(request, *args, **kwargs)
-        response['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
+        response['Cache-Control'] = NEVER_CACHE
         return response
 
     return _wrapped_view
 
 def user_login_required(view_func):
+    if iscoroutinefunction(view_func):
+        async def _wrapped_view(request, *args, **kwargs):
+            if await request.session.aget('user_id') is None:
+                return redirect('login')
+            return await view_func(request, *args, **kwargs)
+
+        return markcoroutinefunction(wraps(view_func)(_wrapped_view))
+
     @wraps(view_func)
     def _wrapped_view(request, *args, **kwargs):
         if 'user_id' not in request.session:
@@ -19,9 +38,17 @@ def user_login_required(view_func):
     return _wrapped_view
 
 def user(view_func):
+    if iscoroutinefunction(view_func):
+        async def _wrapped_view(request, *args, **kwargs):
+            if await request.session.aget('user_id'):
+                return redirect('home_view')
+            return await view_func(request, *args, **kwargs)
+
+        return markcoroutinefunction(wraps(view_func)(_wrapped_view))
+
     @wraps(view_func)
     def _wrapped_view(request, *args, **kwargs):
         if request.session.get('user_id'):
             return redirect('home_view')
         return view_func(request, *args, **kwargs)
-    return _wrapped_view
\ No newline at end of file
+    return _wrapped_view
@@ -1,78 +1,115 @@
 from django.shortcuts import render, redirect
 from .models import Product, User, Contact, About, CartItem, Cart, Order, OrderItem, BillingAddress
 from django.contrib import messages
-from django.contrib.auth.hashers import make_password, check_password
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DecimalField, F, Prefetch, Q, Sum
+from datetime import datetime, timedelta, timezone
+from .cache import (
+    CATALOG_TIMEOUT,
+    aadjust_cart_count,
+    adjust_cart_count,
+    aget_cart_count,
+    aget_catalog_version,
+    catalog_key,
+    catalog_queryset,
+    get_cart_count,
+    PRODUCT_PAGE_TIMEOUT,
+    product_page_key,
+    product_summary,
+    reset_cart_count,
+)
+from .hashing import acheck_password, amake_password
+from .ratelimit import ais_rate_limited
+from .reporting import record_order
+from .warmup import check_database, start_warm_up, state as warmup_state
 from .utils import never_cache_custom, user, user_login_required
-from django.http import JsonResponse, HttpResponseNotAllowed
+from django.http import Http404, JsonResponse, HttpResponseNotAllowed
+from django.template.loader import render_to_string
+from django.utils.cache import patch_cache_control
+from django.utils.safestring import mark_safe
+from django.views.decorators.http import condition
+import hashlib
 import json
 
+ORDER_HISTORY_PAGE_SIZE = 20
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Template rendering (context processors, fragment caches) is synchronous.
+arender = sync_to_async(render)
+
 
 # User Registration
 @never_cache_custom
 @user
-def register(request):
+async def register(request):
     if request.method == "POST":
         name = request.POST["name"]
         email = request.POST["email"]
         phone = request.POST["phone"]
-        password = make_password(request.POST["password"])
         gender = request.POST["gender"]
         age = request.POST["age"]
+        context = {
+            "name": name,
+            "phone": phone,
+            "gender": gender,
+            "age": age,
+        }
+
+        if await ais_rate_limited("register", request, email):
+            messages.error(request, "Too many attempts. Please try again later.")
+            return await arender(request, "product_details/register.html", context, status=429)
 
         # Check if email is already registered
-        if User.objects.filter(email=email).exists():
+        if await User.objects.filter(email=email).aexists():
             messages.error(request, "Email is already registered.")
-            return render(
-                request,
-                "product_details/register.html",
-                {
-                    "name": name,
-                    "phone": phone,
-                    "gender": gender,
-                    "age": age,
-                },
-            )
+            return await arender(request, "product_details/register.html", context)
 
         # Create a new user
-        User.objects.create(
+        await User.objects.acreate(
             name=name,
             email=email,
             phone=phone,
-            password=password,
+            password=await amake_password(request.POST["password"]),
             gender=gender,
             age=age,
         )
         messages.success(request, "Registration successful! Please log in.")
         return redirect("login")
 
-    return render(request, "product_details/register.html")
+    return await arender(request, "product_details/register.html")
 
 # User Login
 @never_cache_custom
 @user
-def login(request):
+async def login(request):
     if request.method == "POST":
         email = request.POST.get("email")
         password = request.POST.get("password")
 
         if not email or not password:
             messages.error(request, "Both email and password are required.")
-            return render(request, "product_details/login.html")
+            return await arender(request, "product_details/login.html")
+
+        if await ais_rate_limited("login", request, email):
+            messages.error(request, "Too many login attempts. Please try again later.")
+            return await arender(request, "product_details/login.html", status=429)
 
         try:
-            user = User.objects.get(email=email)
+            user = await User.objects.aget(email=email)
         except User.DoesNotExist:
             messages.error(request, "User not found.")
-            return render(request, "product_details/login.html")
+            return await arender(request, "product_details/login.html")
 
-        if check_password(password, user.password):
-            request.session["user_id"] = user.id
-            request.session["user_name"] = user.name
+        if await acheck_password(password, user.password):
+            await request.session.aset("user_id", user.id)
+            await request.session.aset("user_name", user.name)
             messages.success(request, f"Welcome, {user.name}!")
             return redirect("home_view")
 
         messages.error(request, "Invalid email or password.")
-    return render(request, "product_details/login.html")
+    return await arender(request, "product_details/login.html")
 
 # User Logout
 def logout(request):
@@ -113,6 +150,73 @@ def shop_view(request):
     products = Product.objects.all()
     return render(request, "product_details/shop.html", {"products": products})
 
+# Product Detail
+def get_product_page(product_id):
+    """
+    Return the cached render of a product's details, building it on a miss.
+    The entry is dropped whenever the product is saved (see signals.py).
+    """
+    key = product_page_key(product_id)
+    page = cache.get(key)
+    if page is None:
+        try:
+            product = Product.objects.get(pk=product_id)
+        except Product.DoesNotExist:
+            raise Http404("Product not found.")
+        page = {
+            "product_name": product.product_name,
+            "last_modified": product.updated_at,
+            "html": render_to_string(
+                "product_details/partials/product_detail_body.html", {"product": product}
+            ),
+        }
+        cache.set(key, page, PRODUCT_PAGE_TIMEOUT)
+    return page
+
+def product_etag(request, product_id):
+    # The page embeds the navbar, so the validator covers the visitor's
+    # login state and cart badge as well as the product itself. The page is
+    # kept on the request so product_detail doesn't fetch it a second time.
+    request.product_page = get_product_page(product_id)
+    user_id = request.session.get("user_id")
+    cart_count = get_cart_count(user_id) if user_id else 0
+    parts = [
+        request.product_page["last_modified"].isoformat(),
+        str(user_id or ""),
+        request.session.get("user_name", ""),
+        str(cart_count),
+    ]
+    return hashlib.md5("|".join(parts).encode("utf-8")).hexdigest()
+
+@condition(etag_func=product_etag)
+def product_detail(request, product_id):
+    page = request.product_page
+    response = render(
+        request,
+        "product_details/product_detail.html",
+        {
+            "product_id": product_id,
+            "product_name": page["product_name"],
+            "product_html": mark_safe(page["html"]),
+        },
+    )
+    # The navbar is per visitor, so browsers may keep the page but must
+    # revalidate it; an unchanged product and navbar answer with 304.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+# Product List / Search JSON
+async def products_json(request):
+    query = request.GET.get("q", "").strip().lower()
+    key = catalog_key(await aget_catalog_version(), query)
+
+    products = await cache.aget(key)
+    if products is None:
+        products = [product_summary(product) async for product in catalog_queryset(query)]
+        await cache.aset(key, products, CATALOG_TIMEOUT)
+
+    return JsonResponse({"products": products})
+
 # Contact Page
 @never_cache_custom
 def contact(request):
@@ -183,6 +287,7 @@ def add_to_cart(request):
             )
             cart_item.quantity += quantity
             cart_item.save()
+            adjust_cart_count(user.id, quantity)
 
             messages.success(request, f"{product.product_name} added to cart.")
         except (User.DoesNotExist, Product.DoesNotExist):
@@ -193,39 +298,61 @@ def add_to_cart(request):
 # Update Cart
 @never_cache_custom
 @user_login_required
-def update_cart(request):
+async def update_cart(request):
     if request.method == "POST":
         data = json.loads(request.body)
         item_id = data["item_id"]
         quantity = data["quantity"]
+        user_id = await request.session.aget("user_id")
+
+        try:
+            cart_item = await CartItem.objects.select_related("product").aget(
+                id=item_id, cart__user_id=user_id
+            )
+        except CartItem.DoesNotExist:
+            return JsonResponse({"success": False}, status=404)
 
-        cart_item = CartItem.objects.get(id=item_id)
+        delta = quantity - cart_item.quantity
         cart_item.quantity = quantity
-        cart_item.save()
+        await cart_item.asave(update_fields=["quantity"])
+        await aadjust_cart_count(user_id, delta)
 
-        cart = cart_item.cart
-        cart.total_price = sum(
-            item.product.price * item.quantity for item in cart.cart_items.all()
+        totals = await CartItem.objects.filter(cart_id=cart_item.cart_id).aaggregate(
+            total=Sum(
+                F("quantity") * F("product__price"),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            )
         )
-        cart.save()
 
         return JsonResponse(
             {
                 "success": True,
                 "item_total_price": cart_item.total_price(),
-                "cart_total_price": cart.total_price,
+                "cart_total_price": totals["total"] or 0,
             }
         )
 
     return HttpResponseNotAllowed(["POST"])
 
+# Cart Badge Count
+@never_cache_custom
+@user_login_required
+async def cart_count(request):
+    user_id = await request.session.aget("user_id")
+    return JsonResponse({"count": await aget_cart_count(user_id)})
+
 # Remove from Cart
 @never_cache_custom
 @user_login_required
 def remove_cart(request):
     if request.method == "POST":
+        user_id = request.session.get("user_id")
         item_id = request.POST.get("item_id")
-        CartItem.objects.filter(id=item_id).delete()
+        cart_items = CartItem.objects.filter(id=item_id, cart__user_id=user_id)
+        removed = cart_items.values_list("quantity", flat=True).first()
+        if removed is not None:
+            cart_items.delete()
+            adjust_cart_count(user_id, -removed)
         messages.success(request, "Item removed from cart.")
 
     return redirect("cart_view")
@@ -262,9 +389,20 @@ def checkout(request):
         billing_address.contact_number = contact_number
         billing_address.save()
 
-        order = Order.objects.create(user=user, total_price=cart.total_price())
-        for item in cart.cart_items.all():
-            OrderItem.objects.create(order=order, product=item.product, quantity=item.quantity)
+        with transaction.atomic():
+            order = Order.objects.create(user=user, total_price=cart.total_price())
+            for item in cart.cart_items.all():
+                OrderItem.objects.create(
+                    order=order,
+                    product=item.product,
+                    quantity=item.quantity,
+                    unit_price=item.product.price,
+                )
+            record_order(order)
+
+            # The cart has been turned into an order.
+            cart.cart_items.all().delete()
+        reset_cart_count(user.id)
 
         return redirect("payment_view", order_id=order.id)
 
@@ -291,3 +429,74 @@ def payment_view(request, order_id):
         return redirect("order_success", order_id=order.id)
 
     return render(request, "product_details/payment.html", {"order": order})
+
+# Order history cursors are "<created_at in microseconds>-<order id>" of the
+# last order on the previous page.
+def encode_order_cursor(order):
+    return f"{(order.created_at - EPOCH) // timedelta(microseconds=1)}-{order.id}"
+
+def decode_order_cursor(cursor):
+    # Anything malformed or out of range falls back to the first page.
+    try:
+        micros, order_id = (int(part) for part in cursor.split("-"))
+        if micros < 0 or order_id < 1:
+            return None
+        return EPOCH + timedelta(microseconds=micros), order_id
+    except (ValueError, OverflowError):
+        return None
+
+# Order History
+@never_cache_custom
+@user_login_required
+def order_history(request):
+    user_id = request.session.get("user_id")
+    orders = (
+        Order.objects.filter(user_id=user_id)
+        .order_by("-created_at", "-id")
+        .prefetch_related(
+            Prefetch("order_items", queryset=OrderItem.objects.select_related("product"))
+        )
+    )
+
+    cursor = decode_order_cursor(request.GET.get("before", ""))
+    if cursor:
+        created_at, order_id = cursor
+        orders = orders.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=order_id)
+        )
+
+    # One extra row tells us whether there is a next page.
+    orders = list(orders[: ORDER_HISTORY_PAGE_SIZE + 1])
+    next_cursor = None
+    if len(orders) > ORDER_HISTORY_PAGE_SIZE:
+        orders = orders[:ORDER_HISTORY_PAGE_SIZE]
+        next_cursor = encode_order_cursor(orders[-1])
+
+    return render(
+        request,
+        "product_details/order_history.html",
+        {
+            "orders": orders,
+            "next_cursor": next_cursor,
+            "is_first_page": cursor is None,
+        },
+    )
+
+# Health Checks
+@never_cache_custom
+def healthz(request):
+    return JsonResponse({"status": "ok"})
+
+@never_cache_custom
+def readyz(request):
+    # Warm-up normally runs in the gunicorn post_worker_init hook. If a probe
+    # gets here first it is started in the background and the worker reports
+    # not ready until it finishes.
+    if not warmup_state["ready"]:
+        start_warm_up()
+        return JsonResponse(warmup_state, status=503)
+    try:
+        check_database()
+    except Exception as exc:
+        return JsonResponse({**warmup_state, "error": str(exc)}, status=503)
+    return JsonResponse(warmup_state)
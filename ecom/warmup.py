@@ -0,0 +1,101 @@
+import threading
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.template.loader import get_template
+from django.urls import get_resolver
+
+from .cache import CATALOG_TIMEOUT, catalog_key, catalog_queryset, get_catalog_version, product_summary
+
+_lock = threading.Lock()
+_thread = None
+
+# Per-process readiness state, reported by the readyz endpoint.
+state = {
+    "ready": False,
+    "import_seconds": None,
+    "warmup_seconds": None,
+    "steps": {},
+    "error": None,
+}
+
+def record_import_time(seconds):
+    state["import_seconds"] = round(seconds, 4)
+
+def warm_urlconf():
+    resolver = get_resolver()
+    # Accessing reverse_dict populates the resolver's lookup tables.
+    resolver.reverse_dict
+
+def warm_templates():
+    root = Path(apps.get_app_config("ecom").path) / "templates"
+    for path in sorted(root.rglob("*.html")):
+        get_template(path.relative_to(root).as_posix())
+
+def check_database():
+    """
+    Verify every database answers from the calling thread. Connections are
+    per thread, so this says nothing about connections other threads hold;
+    it is a reachability check, repeated on every readiness probe.
+    """
+    for connection in connections.all():
+        connection.ensure_connection()
+        if not connection.is_usable():
+            raise DatabaseError(f"Database '{connection.alias}' is not usable.")
+
+def warm_caches():
+    products = [product_summary(product) for product in catalog_queryset("")]
+    cache.set(catalog_key(get_catalog_version(), ""), products, CATALOG_TIMEOUT)
+
+STEPS = [
+    ("urlconf", warm_urlconf),
+    ("templates", warm_templates),
+    ("database", check_database),
+    ("caches", warm_caches),
+]
+
+def warm_up():
+    """
+    Do the lazy first-request work up front: resolve the URLconf, compile
+    every template, check the database and prime the catalog cache.
+    Runs once per process; later calls return the recorded state.
+    """
+    with _lock:
+        if not state["ready"]:
+            started = time.perf_counter()
+            for name, step in STEPS:
+                step_started = time.perf_counter()
+                step()
+                state["steps"][name] = round(time.perf_counter() - step_started, 4)
+            state["warmup_seconds"] = round(time.perf_counter() - started, 4)
+            state["error"] = None
+            state["ready"] = True
+    return state
+
+def run_warm_up():
+    """
+    Run warm_up() and close the database connections it opened. Connections
+    belong to the calling thread, which never serves requests afterwards.
+    """
+    try:
+        return warm_up()
+    finally:
+        connections.close_all()
+
+def _background_warm_up():
+    try:
+        run_warm_up()
+    except Exception as exc:
+        state["error"] = str(exc)
+
+def start_warm_up():
+    """Run warm_up() in a background thread unless it is done or running."""
+    global _thread
+    with _lock:
+        if state["ready"] or (_thread is not None and _thread.is_alive()):
+            return
+        _thread = threading.Thread(target=_background_warm_up, name="warm-up", daemon=True)
+        _thread.start()
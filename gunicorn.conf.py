@@ -0,0 +1,44 @@
+"""
+Gunicorn deployment profile for the ASGI application.
+
+Each worker runs uvicorn's event loop, so slow clients waiting on the async
+views (cart updates, cart count, product JSON) hold a coroutine rather than a
+thread. Every setting can be overridden from the environment.
+"""
+
+import multiprocessing
+import os
+
+# Django does not support persistent database connections under ASGI;
+# pool them externally (e.g. PgBouncer) instead. Workers inherit this.
+os.environ.setdefault("DB_CONN_MAX_AGE", "0")
+
+wsgi_app = "Ecommerce.asgi:application"
+bind = os.environ.get("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Keep idle connections from mobile clients open longer than typical
+# load balancer idle timeouts so they are not torn down mid-session.
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", 75))
+timeout = int(os.environ.get("GUNICORN_TIMEOUT", 30))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT", 30))
+
+accesslog = "-"
+errorlog = "-"
+
+
+def post_worker_init(worker):
+    # Compile templates, resolve URLs, check the database and prime caches
+    # before the worker accepts traffic. Requests run their ORM work in their
+    # own threads, so the connection opened here is closed again afterwards.
+    from ecom.warmup import run_warm_up
+
+    state = run_warm_up()
+    worker.log.info(
+        "Worker %s ready: import %.3fs, warm-up %.3fs %s",
+        worker.pid,
+        state["import_seconds"] or 0,
+        state["warmup_seconds"],
+        state["steps"],
+    )